@@ -1,50 +1,139 @@
-import sys
 import os
-import uvicorn
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.datastructures import Headers
 from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, Union
 import logging
 import httpx
-import openai
+import orjson
+from openai import AsyncOpenAI
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import asyncio
+import gzip
+import time
+import uuid
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-
-# Import your trading functions and utilities
-from utils.binance_client import BinanceClient
-from utils.logger import logger
-from market_orders import place_market_order
-from limit_orders import place_limit_order
-from advanced.stop_limit import place_stop_limit_order
-from advanced.oco import place_oco_order
-from advanced.twap import place_twap_order
-from advanced.grid_strategy import place_grid_orders
+# Import your trading functions and utilities. These use the same `src.` module
+# paths as the order modules, so the app shares their logger and exchange-info cache.
+from src.utils.binance_client import BinanceClient
+from src.utils.logger import logger
+from src.utils.validation import get_exchange_info, ExchangeInfoFetchError
+from src.market_orders import place_market_order
+from src.limit_orders import place_limit_order
+from src.advanced.stop_limit import place_stop_limit_order
+from src.advanced.oco import place_oco_order
+from src.advanced.twap import place_twap_order, plan_twap_order
+from src.advanced.grid_strategy import place_grid_orders
 
 # Load environment variables for the OpenAI API key
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Shared HTTP connection pool, Binance client and OpenAI client, created per worker in `lifespan`
+http_client = None
+binance_client = None
+openai_client = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Creates the HTTP connection pool, Binance client and OpenAI client when a worker starts.
+    Under Gunicorn with --preload the app is imported once before forking, so
+    these are built here instead of at import time to give each worker its own
+    sockets. The pool is reused by every request and closed on shutdown.
+    Exchange info used for order validation is loaded up front, off the event
+    loop, and refreshed in the background. If this first load fails it is only
+    retried in the background, and orders are rejected until it succeeds, so
+    validation never fetches it inside a request.
+    """
+    global http_client, binance_client, openai_client
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30),
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+    )
+    try:
+        binance_client = BinanceClient.get(mainnet=False, http_client=http_client)
+    except ValueError:
+        logger.error("Failed to initialize Binance client. Check API keys.")
+        await http_client.aclose()
+        raise
+    if OPENAI_API_KEY:
+        openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+    # Kept fresh afterwards by ExchangeInfo's own background refresh timer
+    try:
+        await asyncio.to_thread(get_exchange_info, binance_client)
+    except ExchangeInfoFetchError:
+        # Orders are rejected until a later validation manages to fetch it
+        logger.warning("Starting without exchange info.")
+    yield
+    await http_client.aclose()
+
+# Tradable symbols change a few times a day at most, so /assets serves them
+# from memory and only refetches exchange info once the TTL has passed. The
+# body is kept pre-serialized (and pre-compressed) so cache hits skip JSON
+# encoding and gzip entirely.
+ASSETS_CACHE_TTL = 300
+_assets_cache = {"raw": None, "gz": None, "expires": 0.0}
+_assets_lock = asyncio.Lock()
+
+# Rationales are effectively deterministic for a given symbol/side/amount, so
+# repeat requests are answered from this cache instead of calling OpenAI again.
+RATIONALE_SYSTEM_PROMPT = "You are a professional financial assistant."
+_rationale_cache = TTLCache(maxsize=10000, ttl=3600)
+
+def get_binance_client():
+    """
+    Dependency that provides the worker's shared BinanceClient.
+    """
+    return binance_client
 
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Origins allowed to call the API, e.g. index.html served by a local dev server.
+# Override with a comma-separated CORS_ORIGINS environment variable.
+CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:5500").split(",")
 
 # Configure CORS to allow communication from your HTML file
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins for local development
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
 )
 
-# Initialize Binance client globally
-try:
-    binance_client = BinanceClient(mainnet=False)
-except ValueError:
-    logger.error("Failed to initialize Binance client. Check API keys.")
-    sys.exit(1)
+class HealthCheckMiddleware:
+    """
+    Answers GET and HEAD /health before any other middleware or routing runs,
+    so health-check traffic skips CORS processing and the FastAPI router.
+    Allowed browser origins still get an Access-Control-Allow-Origin header.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != "/health" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        headers = {}
+        origin = Headers(scope=scope).get("origin")
+        if origin in CORS_ORIGINS:
+            headers = {"access-control-allow-origin": origin, "vary": "Origin"}
+        response = Response(content=b'{"status":"ok"}', media_type="application/json", headers=headers)
+        await response(scope, receive, send)
+
+# Compress larger responses for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Added last so it is the outermost middleware
+app.add_middleware(HealthCheckMiddleware)
 
 # --- Pydantic Models for Request Validation ---
 class TradeRequestBase(BaseModel):
@@ -54,141 +143,235 @@ class TradeRequestBase(BaseModel):
     amount: float
 
 class ManualTradeRequest(TradeRequestBase):
-    price: float = None
+    strategy: Literal["manual"] = "manual"
+    price: Optional[float] = None
     time_in_force: str = Field("GTC", alias="time-in-force")
 
 class TwapTradeRequest(TradeRequestBase):
+    strategy: Literal["twap"] = "twap"
     duration: int
     interval: int
 
 class OcoTradeRequest(TradeRequestBase):
+    strategy: Literal["oco"] = "oco"
     tp: float
     sl: float
 
 class GridTradeRequest(TradeRequestBase):
+    strategy: Literal["grid"] = "grid"
     side: str = Field("BUY") # Default for grid strategy
     lower_bound: float
     upper_bound: float
     num_levels: int
 
 class StopLimitTradeRequest(BaseModel):
-    strategy: str
+    strategy: Literal["stop-limit"] = "stop-limit"
     side: str
     symbol: str
     amount: float
     stop_price: float
     limit_price: float
 
+# The `strategy` field selects the model, so a request body is validated once
+# against the matching schema.
+TradeRequest = Annotated[
+    Union[ManualTradeRequest, TwapTradeRequest, OcoTradeRequest, GridTradeRequest, StopLimitTradeRequest],
+    Field(discriminator="strategy"),
+]
+
 # --- API Endpoints ---
-@app.get("/health")
-def health_check():
+def accepts_gzip(accept_encoding):
+    """
+    Checks an Accept-Encoding header for gzip with a non-zero q-value.
+    An explicit gzip entry wins; otherwise a "*" entry decides.
+    :param accept_encoding: The raw Accept-Encoding header value.
+    :return: True if a gzip-compressed response is acceptable.
     """
-    A simple health check endpoint to confirm the server is running.
+    qvalues = {}
+    for entry in accept_encoding.split(","):
+        coding, *params = entry.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    if "gzip" in qvalues:
+        return qvalues["gzip"] > 0
+    return qvalues.get("*", 0) > 0
+
+def cached_assets_response(request):
+    """
+    Returns the cached /assets body, gzip-compressed if the client accepts it.
     """
-    return {"status": "ok"}
+    # The body depends on Accept-Encoding, so caches must key on it either way
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=_assets_cache["gz"], media_type="application/json", headers=headers)
+    return Response(content=_assets_cache["raw"], media_type="application/json", headers=headers)
 
 @app.get("/assets")
-def get_assets():
+async def get_assets(request: Request, client: BinanceClient = Depends(get_binance_client)):
     """
     Fetches the list of all available trading symbols from the Binance Testnet.
+    The list is cached for ASSETS_CACHE_TTL seconds.
     """
+    if time.time() < _assets_cache["expires"]:
+        return cached_assets_response(request)
     try:
-        exchange_info = binance_client.get_client().futures_exchange_info()
-        symbols = [s['symbol'] for s in exchange_info['symbols'] if s['status'] == 'TRADING']
-        return {"symbols": symbols}
+        async with _assets_lock:
+            # Another request may have refreshed the cache while we waited
+            if time.time() < _assets_cache["expires"]:
+                return cached_assets_response(request)
+            exchange_info = await client.get_async_client().futures_exchange_info()
+            symbols = [s['symbol'] for s in exchange_info['symbols'] if s['status'] == 'TRADING']
+            _assets_cache["raw"] = orjson.dumps({"symbols": symbols})
+            _assets_cache["gz"] = gzip.compress(_assets_cache["raw"])
+            _assets_cache["expires"] = time.time() + ASSETS_CACHE_TTL
+            return cached_assets_response(request)
     except Exception as e:
         logger.error(f"Error fetching assets from Binance: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch trading assets.")
 
 @app.get("/price/{symbol}")
-def get_live_price(symbol: str):
+async def get_live_price(symbol: str, client: BinanceClient = Depends(get_binance_client)):
     """
     Fetches the live market price for a given symbol.
     """
     try:
-        ticker = binance_client.get_client().futures_symbol_ticker(symbol=symbol)
+        ticker = await client.get_async_client().futures_symbol_ticker(symbol=symbol)
         return {"symbol": ticker['symbol'], "price": float(ticker['price'])}
     except Exception as e:
         logger.error(f"Error fetching live price for {symbol}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch live price.")
 
 
-@app.post("/trade")
-def place_trade(request: dict):
+async def execute_trade(req, order):
     """
-    Unified endpoint to handle all trading strategies.
-    The function will dynamically validate and route the request
-    to the correct trading function.
+    Awaits an order-placement coroutine and builds the trade response.
     """
-    strategy = request.get("strategy")
-    if not strategy:
-        raise HTTPException(status_code=400, detail="Strategy not specified.")
-
     try:
-        # Pydantic models automatically validate the input data
-        if strategy == "manual":
-            if "price" not in request or not request["price"]:
-                validated_request = ManualTradeRequest(**{**request, "price": None})
-                result = place_market_order(binance_client, validated_request.symbol, validated_request.side, validated_request.amount)
-            else:
-                validated_request = ManualTradeRequest(**request)
-                result = place_limit_order(binance_client, validated_request.symbol, validated_request.side, validated_request.amount, validated_request.price, validated_request.time_in_force)
-        elif strategy == "twap":
-            validated_request = TwapTradeRequest(**request)
-            result = place_twap_order(binance_client, validated_request.symbol, validated_request.side, validated_request.amount, validated_request.duration, validated_request.interval)
-        elif strategy == "oco":
-            validated_request = OcoTradeRequest(**request)
-            result = place_oco_order(binance_client, validated_request.symbol, validated_request.side, validated_request.amount, validated_request.tp, validated_request.sl)
-        elif strategy == "grid":
-            validated_request = GridTradeRequest(**request)
-            result = place_grid_orders(binance_client, validated_request.symbol, validated_request.lower_bound, validated_request.upper_bound, validated_request.num_levels, validated_request.amount)
-        elif strategy == "stop-limit":
-            validated_request = StopLimitTradeRequest(**request)
-            result = place_stop_limit_order(binance_client, validated_request.symbol, validated_request.side, validated_request.amount, validated_request.stop_price, validated_request.limit_price)
-        else:
-            raise HTTPException(status_code=400, detail="Invalid strategy.")
-
-        if result:
-            return {"status": "success", "message": f"Order for '{validated_request.symbol}' placed successfully.", "details": result}
-        else:
-            return {"status": "error", "message": "Failed to place order. See logs for details."}
+        result = await order
     except Exception as e:
         logger.error(f"Error processing trade request: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+    if result:
+        return {"status": "success", "message": f"Order for '{req.symbol}' placed successfully.", "details": result}
+    else:
+        return {"status": "error", "message": "Failed to place order. See logs for details."}
+
+@app.post("/trade/manual")
+async def trade_manual(req: ManualTradeRequest, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Places a market order, or a limit order when a price is given.
+    """
+    # A price of 0 is still a limit order, and is rejected by validation
+    if req.price is None:
+        return await execute_trade(req, place_market_order(client, req.symbol, req.side, req.amount))
+    return await execute_trade(req, place_limit_order(client, req.symbol, req.side, req.amount, req.price, req.time_in_force))
+
+@app.post("/trade/twap")
+async def trade_twap(req: TwapTradeRequest, background_tasks: BackgroundTasks, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Schedules a TWAP order to run in the background and returns a job ID immediately.
+    The sub-order quantity is validated first, so an order that can never be placed
+    is rejected here instead of failing later in the background.
+    """
+    if plan_twap_order(client, req.symbol, req.amount, req.duration, req.interval) is None:
+        return {"status": "error", "message": "Failed to place order. See logs for details."}
+    job_id = uuid.uuid4().hex
+    background_tasks.add_task(place_twap_order, client, req.symbol, req.side, req.amount, req.duration, req.interval, job_id)
+    logger.info("TWAP order scheduled.", extra={'details': {'job_id': job_id, 'symbol': req.symbol}})
+    return {"status": "success", "message": f"TWAP order for '{req.symbol}' scheduled.", "details": {"job_id": job_id}}
+
+@app.post("/trade/oco")
+async def trade_oco(req: OcoTradeRequest, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Places a simulated OCO order (take-profit and stop-loss).
+    """
+    return await execute_trade(req, place_oco_order(client, req.symbol, req.side, req.amount, req.tp, req.sl))
+
+@app.post("/trade/grid")
+async def trade_grid(req: GridTradeRequest, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Places a static grid of limit orders.
+    """
+    return await execute_trade(req, place_grid_orders(client, req.symbol, req.lower_bound, req.upper_bound, req.num_levels, req.amount))
+
+@app.post("/trade/stop-limit")
+async def trade_stop_limit(req: StopLimitTradeRequest, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Places a stop-limit order.
+    """
+    return await execute_trade(req, place_stop_limit_order(client, req.symbol, req.side, req.amount, req.stop_price, req.limit_price))
+
+@app.post("/trade")
+async def place_trade(req: TradeRequest, background_tasks: BackgroundTasks, client: BinanceClient = Depends(get_binance_client)):
+    """
+    Unified endpoint kept for compatibility with existing clients.
+    FastAPI validates the body against the model selected by `strategy`,
+    and the request is handed to the matching /trade/<strategy> handler.
+    """
+    match req:
+        case ManualTradeRequest():
+            return await trade_manual(req, client)
+        case TwapTradeRequest():
+            return await trade_twap(req, background_tasks, client)
+        case OcoTradeRequest():
+            return await trade_oco(req, client)
+        case GridTradeRequest():
+            return await trade_grid(req, client)
+        case StopLimitTradeRequest():
+            return await trade_stop_limit(req, client)
+
 @app.post("/generate_rationale")
 async def generate_rationale(request: dict):
     """
     Generates a trade rationale using the OpenAI API based on trade parameters.
     """
-    if not openai.api_key:
+    if openai_client is None:
         raise HTTPException(status_code=500, detail="OpenAI API key is not configured.")
 
+    symbol = request.get('symbol')
+    side = request.get('side')
+    amount = request.get('amount')
+    if isinstance(amount, (int, float)):
+        amount = round(amount, 4)
+
+    cache_key = (symbol, side, amount)
+    if cache_key in _rationale_cache:
+        return {"status": "success", "rationale": _rationale_cache[cache_key]}
+
     try:
         # Construct the prompt for the LLM
         prompt_message = (
             f"Generate a short, concise, and professional-sounding rationale for a trading order "
-            f"with the following parameters: Symbol: {request.get('symbol')}, "
-            f"Side: {request.get('side')}, Amount: {request.get('amount')}. "
+            f"with the following parameters: Symbol: {symbol}, "
+            f"Side: {side}, Amount: {amount}. "
             f"The rationale should be suitable for a log entry."
         )
 
-        response = openai.chat.completions.create(
+        # The static system prompt goes first so OpenAI can reuse the cached prefix
+        response = await openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
-                {"role": "system", "content": "You are a professional financial assistant."},
+                {"role": "system", "content": RATIONALE_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt_message}
-            ]
+            ],
+            temperature=0,
+            max_tokens=80
         )
 
         # Extract the generated text from the response
         rationale_text = response.choices[0].message.content
+        _rationale_cache[cache_key] = rationale_text
         return {"status": "success", "rationale": rationale_text}
             
     except Exception as e:
         logger.error(f"Error generating rationale: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate rationale: {e}")
-
-# If you want to run this file directly with `python app.py`
-if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for the FastAPI backend, picked up automatically by:
+#   gunicorn app:app
+# Equivalent to:
+#   gunicorn app:app -k uvicorn.workers.UvicornWorker -w $(nproc) --preload --bind 127.0.0.1:8000
+
+# The API places orders with your Binance keys and has no authentication, so it
+# only listens on localhost by default. Set BIND (e.g. BIND=0.0.0.0:8000) to
+# expose it, only behind something that restricts who can reach it.
+bind = os.getenv("BIND", "127.0.0.1:8000")
+
+# One Uvicorn worker per CPU core. UvicornWorker uses uvloop and httptools when installed.
+workers = multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app (and logger) once before forking; each worker creates its
+# own Binance client in the app's lifespan handler.
+preload_app = True
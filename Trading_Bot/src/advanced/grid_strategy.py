@@ -1,11 +1,37 @@
 import argparse
+import asyncio
 import sys
+import numpy as np
 from binance.enums import *
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_inputs, get_exchange_info, prewarm_exchange_info, ExchangeInfoFetchError
 
-def place_grid_orders(client, symbol, lower_bound, upper_bound, num_levels, quantity_per_level):
+# Grid orders are sent concurrently; cap in-flight requests to stay within
+# Binance's request-weight rate limits.
+GRID_MAX_CONCURRENT_ORDERS = 10
+
+def _round_to_tick(client, symbol, prices):
+    """
+    Snaps grid prices to the symbol's tick size so they pass price validation.
+    Prices are returned unchanged if the symbol's price filter is unavailable.
+    :param client: BinanceClient instance.
+    :param symbol: Trading symbol.
+    :param prices: NumPy array of grid prices.
+    """
+    try:
+        limits = get_exchange_info(client).get_symbol_limits(symbol)
+    except ExchangeInfoFetchError:
+        return prices
+    if not limits:
+        return prices
+
+    # Round in integer units of the price precision; dividing the whole number
+    # of units by the power-of-ten scale gives the nearest float to each tick
+    ticks = np.round((prices * limits.price_scale - limits.min_price_units) / limits.tick_units)
+    return (ticks * limits.tick_units + limits.min_price_units) / limits.price_scale
+
+async def place_grid_orders(client, symbol, lower_bound, upper_bound, num_levels, quantity_per_level):
     """
     Places a simple grid trading strategy.
     This function places a series of limit buy and sell orders at
@@ -24,20 +50,33 @@ def place_grid_orders(client, symbol, lower_bound, upper_bound, num_levels, quan
             logger.error("Number of grid levels must be greater than 1.")
             return
 
-        price_step = (upper_bound - lower_bound) / (num_levels - 1)
-        orders = []
+        prices = _round_to_tick(client, symbol, np.linspace(lower_bound, upper_bound, num_levels))
+        # Levels closer together than the tick size collapse onto the same price;
+        # placing them would stack several identical orders at one level
+        if np.unique(prices).size < num_levels:
+            logger.error(
+                f"Grid levels are closer together than the tick size; {num_levels} levels between "
+                f"{lower_bound} and {upper_bound} would place duplicate orders. Aborting grid placement."
+            )
+            return
 
-        for i in range(num_levels):
-            # Place buy orders below a central point and sell orders above
-            order_price = lower_bound + i * price_step
-            order_side = "BUY" if order_price < (lower_bound + upper_bound) / 2 else "SELL"
+        # Place buy orders below a central point and sell orders above
+        sides = np.where(prices < (prices[0] + prices[-1]) / 2, "BUY", "SELL")
+        levels = list(zip(sides.tolist(), prices.tolist()))
+
+        # Validate every level before sending anything, so a bad grid places no orders
+        valid = validate_inputs(client, [(symbol, quantity_per_level, order_price) for _, order_price in levels])
+        if not all(valid):
+            order_price = levels[valid.index(False)][1]
+            logger.error(f"Grid order validation failed at price {order_price}. Aborting grid placement.")
+            return
 
-            if not validate_input(client, symbol, quantity_per_level, order_price):
-                logger.error(f"Grid order validation failed at price {order_price}. Aborting grid placement.")
-                return
+        semaphore = asyncio.Semaphore(GRID_MAX_CONCURRENT_ORDERS)
+        create_order = client.get_async_client().futures_create_order
 
-            try:
-                order = client.get_client().futures_create_order(
+        async def place_level(order_side, order_price):
+            async with semaphore:
+                order = await create_order(
                     symbol=symbol,
                     side=order_side,
                     type=FUTURE_ORDER_TYPE_LIMIT,
@@ -45,14 +84,24 @@ def place_grid_orders(client, symbol, lower_bound, upper_bound, num_levels, quan
                     price=order_price,
                     timeInForce="GTC"
                 )
-                orders.append(order)
-                logger.info(
-                    f"Grid order placed: {order_side} {quantity_per_level} at {order_price}",
-                    extra={'details': order}
-                )
-            except Exception as e:
-                client.handle_error(e)
-                logger.warning(f"Failed to place grid order at price {order_price}. Continuing to next level.")
+            logger.info(
+                f"Grid order placed: {order_side} {quantity_per_level} at {order_price}",
+                extra={'details': order}
+            )
+            return order
+
+        results = await asyncio.gather(
+            *(place_level(order_side, order_price) for order_side, order_price in levels),
+            return_exceptions=True
+        )
+
+        orders = []
+        for (_, order_price), result in zip(levels, results):
+            if isinstance(result, Exception):
+                client.handle_error(result)
+                logger.warning(f"Failed to place grid order at price {order_price}. Continuing with remaining levels.")
+            else:
+                orders.append(result)
 
         logger.info("Static grid strategy orders placed successfully.", extra={'details': {'orders_count': len(orders)}})
         return orders
@@ -77,7 +126,8 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_grid_orders(binance_client, args.symbol, args.lower_bound, args.upper_bound, args.num_levels, args.quantity_per_level)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_grid_orders(binance_client, args.symbol, args.lower_bound, args.upper_bound, args.num_levels, args.quantity_per_level))
     except Exception:
         sys.exit(1)
@@ -1,10 +1,11 @@
 import argparse
+import asyncio
 import sys
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_inputs, prewarm_exchange_info
 
-def place_oco_order(client, symbol, side, quantity, take_profit, stop_loss):
+async def place_oco_order(client, symbol, side, quantity, take_profit, stop_loss):
     """
     Places a simulated One-Cancels-the-Other (OCO) order.
     Binance Futures API does not have a native OCO type, so we
@@ -21,15 +22,15 @@ def place_oco_order(client, symbol, side, quantity, take_profit, stop_loss):
     """
     try:
         # Validate inputs
-        if not validate_input(client, symbol, quantity, take_profit) or not validate_input(client, symbol, quantity, stop_loss):
+        if not all(validate_inputs(client, [(symbol, quantity, take_profit), (symbol, quantity, stop_loss)])):
             logger.error("Input validation failed, aborting OCO order placement.")
             return
 
-        client_instance = client.get_client()
+        client_instance = client.get_async_client()
 
         # Place a Take Profit Limit Order
         tp_side = "SELL" if side == "BUY" else "BUY"
-        tp_order = client_instance.futures_create_order(
+        tp_order = await client_instance.futures_create_order(
             symbol=symbol,
             side=tp_side,
             type='TAKE_PROFIT',
@@ -39,7 +40,7 @@ def place_oco_order(client, symbol, side, quantity, take_profit, stop_loss):
 
         # Place a Stop Market Order
         sl_side = "SELL" if side == "BUY" else "BUY"
-        sl_order = client_instance.futures_create_order(
+        sl_order = await client_instance.futures_create_order(
             symbol=symbol,
             side=sl_side,
             type='STOP',
@@ -73,7 +74,8 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_oco_order(binance_client, args.symbol, args.side, args.quantity, args.tp, args.sl)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_oco_order(binance_client, args.symbol, args.side, args.quantity, args.tp, args.sl))
     except Exception:
         sys.exit(1)
\ No newline at end of file
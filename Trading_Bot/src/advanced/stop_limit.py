@@ -1,11 +1,12 @@
 import argparse
+import asyncio
 import sys
 from binance.enums import *
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_input, prewarm_exchange_info
 
-def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_price):
+async def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_price):
     """
     Places a stop-limit order. The limit order is placed once the stop price is reached.
     :param client: BinanceClient instance.
@@ -22,7 +23,7 @@ def place_stop_limit_order(client, symbol, side, quantity, stop_price, limit_pri
             return
 
         # Note: Stop-limit orders on futures require both stopPrice and price
-        order = client.get_client().futures_create_order(
+        order = await client.get_async_client().futures_create_order(
             symbol=symbol,
             side=side,
             type=FUTURE_ORDER_TYPE_STOP,
@@ -54,7 +55,8 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_stop_limit_order(binance_client, args.symbol, args.side, args.quantity, args.stop_price, args.limit_price)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_stop_limit_order(binance_client, args.symbol, args.side, args.quantity, args.stop_price, args.limit_price))
     except Exception:
         sys.exit(1)
\ No newline at end of file
@@ -1,12 +1,35 @@
 import argparse
+import asyncio
 import sys
-import time
 from binance.enums import *
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_input, prewarm_exchange_info
 
-def place_twap_order(client, symbol, side, total_quantity, duration_minutes, interval_seconds):
+def plan_twap_order(client, symbol, total_quantity, duration_minutes, interval_seconds):
+    """
+    Splits a TWAP order into equal sub-orders and validates the sub-order quantity.
+    :param client: BinanceClient instance.
+    :param symbol: Trading symbol.
+    :param total_quantity: The total quantity to be traded.
+    :param duration_minutes: The total duration for the TWAP in minutes.
+    :param interval_seconds: The interval between smaller orders in seconds.
+    :return: (num_intervals, quantity_per_order), or None if the order can't be placed.
+    """
+    num_intervals = int((duration_minutes * 60) // interval_seconds)
+    if num_intervals == 0:
+        logger.error("Duration is too short for the given interval. No orders will be placed.")
+        return None
+
+    quantity_per_order = total_quantity / num_intervals
+    # Every sub-order has the same quantity, so validate it once up front
+    if not validate_input(client, symbol, quantity_per_order):
+        logger.error("TWAP sub-order validation failed. Aborting.")
+        return None
+
+    return num_intervals, quantity_per_order
+
+async def place_twap_order(client, symbol, side, total_quantity, duration_minutes, interval_seconds, job_id=None):
     """
     Places a Time-Weighted Average Price (TWAP) order.
     This function breaks down a large order into smaller market orders
@@ -17,27 +40,23 @@ def place_twap_order(client, symbol, side, total_quantity, duration_minutes, int
     :param total_quantity: The total quantity to be traded.
     :param duration_minutes: The total duration for the TWAP in minutes.
     :param interval_seconds: The interval between smaller orders in seconds.
+    :param job_id: Optional ID included in every log record, e.g. the API's TWAP job ID.
     """
     try:
-        num_intervals = (duration_minutes * 60) // interval_seconds
-        if num_intervals == 0:
-            logger.error("Duration is too short for the given interval. No orders will be placed.")
+        plan = plan_twap_order(client, symbol, total_quantity, duration_minutes, interval_seconds)
+        if plan is None:
             return
+        num_intervals, quantity_per_order = plan
 
-        quantity_per_order = total_quantity / num_intervals
         logger.info(
             f"Starting TWAP for {symbol}. Placing {num_intervals} orders of {quantity_per_order} every {interval_seconds} seconds.",
-            extra={'details': {'total_qty': total_quantity, 'duration': duration_minutes, 'interval': interval_seconds}}
+            extra={'details': {'job_id': job_id, 'total_qty': total_quantity, 'duration': duration_minutes, 'interval': interval_seconds}}
         )
 
-        for i in range(int(num_intervals)):
-            # Validate each sub-order's quantity
-            if not validate_input(client, symbol, quantity_per_order):
-                logger.error("TWAP sub-order validation failed. Aborting.")
-                return
-
+        create_order = client.get_async_client().futures_create_order
+        for i in range(num_intervals):
             try:
-                order = client.get_client().futures_create_order(
+                order = await create_order(
                     symbol=symbol,
                     side=side,
                     type=FUTURE_ORDER_TYPE_MARKET,
@@ -45,16 +64,17 @@ def place_twap_order(client, symbol, side, total_quantity, duration_minutes, int
                 )
                 logger.info(
                     f"TWAP order {i+1}/{num_intervals} placed successfully.",
-                    extra={'details': order}
+                    extra={'details': {'job_id': job_id, 'order': order}}
                 )
             except Exception as e:
                 client.handle_error(e)
                 # Continue placing orders even if one fails
-                logger.warning("TWAP sub-order failed, continuing to next interval.")
+                logger.warning("TWAP sub-order failed, continuing to next interval.", extra={'details': {'job_id': job_id}})
 
             if i < num_intervals - 1:
-                time.sleep(interval_seconds)
+                await asyncio.sleep(interval_seconds)
 
+        logger.info("TWAP order finished.", extra={'details': {'job_id': job_id}})
     except Exception as e:
         client.handle_error(e)
 
@@ -76,7 +96,8 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_twap_order(binance_client, args.symbol, args.side, args.total_quantity, args.duration, args.interval)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_twap_order(binance_client, args.symbol, args.side, args.total_quantity, args.duration, args.interval))
     except Exception:
         sys.exit(1)
@@ -1,11 +1,12 @@
 import argparse
+import asyncio
 import sys
 from binance.enums import *
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_input, prewarm_exchange_info
 
-def place_limit_order(client, symbol, side, quantity, price, time_in_force="GTC"):
+async def place_limit_order(client, symbol, side, quantity, price, time_in_force="GTC"):
     """
     Places a limit order on Binance Futures.
     :param client: BinanceClient instance.
@@ -21,7 +22,7 @@ def place_limit_order(client, symbol, side, quantity, price, time_in_force="GTC"
             logger.error("Input validation failed, aborting order placement.")
             return
 
-        order = client.get_client().futures_create_order(
+        order = await client.get_async_client().futures_create_order(
             symbol=symbol,
             side=side,
             type=FUTURE_ORDER_TYPE_LIMIT,
@@ -54,7 +55,8 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_limit_order(binance_client, args.symbol, args.side, args.quantity, args.price, args.time_in_force)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_limit_order(binance_client, args.symbol, args.side, args.quantity, args.price, args.time_in_force))
     except Exception:
         sys.exit(1)
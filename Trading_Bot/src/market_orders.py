@@ -1,11 +1,12 @@
 import argparse
+import asyncio
 import sys
 from binance.enums import *
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
-from src.utils.validation import validate_input
+from src.utils.validation import validate_input, prewarm_exchange_info
 
-def place_market_order(client, symbol, side, quantity):
+async def place_market_order(client, symbol, side, quantity):
     """
     Places a market order on Binance Futures.
     :param client: BinanceClient instance.
@@ -19,7 +20,7 @@ def place_market_order(client, symbol, side, quantity):
             logger.error("Input validation failed, aborting order placement.")
             return
 
-        order = client.get_client().futures_create_order(
+        order = await client.get_async_client().futures_create_order(
             symbol=symbol,
             side=side,
             type=FUTURE_ORDER_TYPE_MARKET,
@@ -47,8 +48,9 @@ if __name__ == "__main__":
             sys.exit(0)
 
     try:
-        binance_client = BinanceClient(mainnet=args.mainnet)
-        place_market_order(binance_client, args.symbol, args.side, args.quantity)
+        binance_client = BinanceClient.get(mainnet=args.mainnet)
+        prewarm_exchange_info(binance_client)
+        asyncio.run(place_market_order(binance_client, args.symbol, args.side, args.quantity))
     except Exception:
         # Errors are already logged within BinanceClient.handle_error
         sys.exit(1)
\ No newline at end of file
@@ -1,4 +1,10 @@
 import os
+import hmac
+import hashlib
+import time
+from functools import lru_cache
+from urllib.parse import urlencode
+import httpx
 from dotenv import load_dotenv
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
@@ -7,16 +13,82 @@ from src.utils.logger import logger
 # Load environment variables from .env file
 load_dotenv()
 
+FUTURES_URL = "https://fapi.binance.com"
+FUTURES_TESTNET_URL = "https://testnet.binancefuture.com"
+
+# handle_error attaches a stack trace to the first error and then to every Nth one
+TRACEBACK_SAMPLE_RATE = 50
+
+class AsyncFuturesClient:
+    """
+    A minimal asyncio client for the Binance USDT-M Futures REST API.
+    Requests are signed with HMAC-SHA256 and sent over a pooled
+    httpx.AsyncClient, so order placement never blocks the event loop.
+    """
+    def __init__(self, api_key, api_secret, testnet=True, http_client=None):
+        """
+        :param api_key: Binance API key.
+        :param api_secret: Binance API secret used to sign requests.
+        :param testnet: Boolean to target the Futures Testnet. Defaults to True.
+        :param http_client: Optional shared httpx.AsyncClient. If omitted, a
+                            private connection pool is created.
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = FUTURES_TESTNET_URL if testnet else FUTURES_URL
+        self.headers = {"X-MBX-APIKEY": api_key}
+        self.http_client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=40),
+            http2=True,
+        )
+
+    def _sign(self, params):
+        """
+        Adds a timestamp to the parameters and returns the signed query string.
+        """
+        params["timestamp"] = int(time.time() * 1000)
+        query = urlencode(params)
+        signature = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def _request(self, method, path, signed=False, **params):
+        """
+        Sends a request and returns the decoded JSON body.
+        Raises BinanceAPIException on a non-2xx response.
+        """
+        query = self._sign(params) if signed else urlencode(params)
+        url = f"{self.base_url}{path}?{query}" if query else f"{self.base_url}{path}"
+        response = await self.http_client.request(method, url, headers=self.headers)
+        if not response.is_success:
+            raise BinanceAPIException(response, response.status_code, response.text)
+        return response.json()
+
+    async def futures_create_order(self, **params):
+        return await self._request("POST", "/fapi/v1/order", signed=True, **params)
+
+    async def futures_exchange_info(self):
+        return await self._request("GET", "/fapi/v1/exchangeInfo")
+
+    async def futures_symbol_ticker(self, **params):
+        return await self._request("GET", "/fapi/v1/ticker/price", **params)
+
+    async def aclose(self):
+        """
+        Closes the underlying HTTP connection pool.
+        """
+        await self.http_client.aclose()
+
 class BinanceClient:
     """
     A wrapper class for the Binance Client to handle API key loading,
     environment switching, and common exceptions.
     """
-    def __init__(self, mainnet=False):
+    def __init__(self, mainnet=False, http_client=None):
         """
         Initializes the Binance client.
         :param mainnet: Boolean to specify if Mainnet should be used.
                         Defaults to False (Testnet).
+        :param http_client: Optional shared httpx.AsyncClient for async requests.
         """
         self.api_key = os.getenv("BINANCE_API_KEY")
         self.api_secret = os.getenv("BINANCE_API_SECRET")
@@ -28,30 +100,63 @@ class BinanceClient:
             )
             raise ValueError("API keys not found.")
 
-        # Set the Testnet vs Mainnet URL based on the flag
-        if mainnet:
-            self.client = Client(self.api_key, self.api_secret)
-        else:
-            self.client = Client(self.api_key, self.api_secret, testnet=True)
+        self.mainnet = mainnet
+        if not mainnet:
             logger.info("Using Binance Futures TESTNET.", extra={'details': 'Testnet mode enabled.'})
 
+        self._error_count = 0
+
+        # The sync Client pings Binance and opens its own session on construction,
+        # so it is only created once something needs it (see get_client).
+        self.client = None
+        self.async_client = AsyncFuturesClient(self.api_key, self.api_secret, testnet=not mainnet, http_client=http_client)
+
+    @classmethod
+    @lru_cache(maxsize=2)
+    def get(cls, mainnet=False, http_client=None):
+        """
+        Returns the process-wide BinanceClient for the given network,
+        creating it on first use so its connections are reused.
+        :param mainnet: Boolean to specify if Mainnet should be used.
+        :param http_client: Optional shared httpx.AsyncClient for async requests.
+        """
+        return cls(mainnet=mainnet, http_client=http_client)
+
     def get_client(self):
         """
-        Returns the configured Binance Client instance.
+        Returns the configured Binance Client instance, creating it on first use.
         """
+        if self.client is None:
+            # Set the Testnet vs Mainnet URL based on the flag
+            if self.mainnet:
+                self.client = Client(self.api_key, self.api_secret)
+            else:
+                self.client = Client(self.api_key, self.api_secret, testnet=True)
         return self.client
 
+    def get_async_client(self):
+        """
+        Returns the AsyncFuturesClient used for non-blocking order placement.
+        """
+        return self.async_client
+
     def handle_error(self, e):
         """
         A centralized error handler for Binance exceptions.
-        Logs the error with a full stack trace.
+        Logs the error, with a full stack trace for the first error and then
+        every TRACEBACK_SAMPLE_RATE-th one, so bursts of failing orders
+        (e.g. TWAP or grid) don't format a traceback for every failure.
         """
+        self._error_count += 1
+        # Pass the exception itself rather than True, so the trace is logged even
+        # when called outside an except block (e.g. on results from asyncio.gather)
+        exc_info = e if self._error_count % TRACEBACK_SAMPLE_RATE == 1 else None
         if isinstance(e, (BinanceAPIException, BinanceRequestException)):
             logger.error(
                 f"Binance API Error: {e.status_code} - {e.message}",
-                exc_info=True,
+                exc_info=exc_info,
                 extra={'details': {'status_code': e.status_code, 'message': e.message}}
             )
         else:
-            logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+            logger.error(f"An unexpected error occurred: {e}", exc_info=exc_info)
 
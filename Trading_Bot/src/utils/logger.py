@@ -1,6 +1,9 @@
 import logging
-from logging.handlers import RotatingFileHandler
-import json
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import atexit
+import os
+import queue
+import orjson
 import sys
 
 # Define a custom JSON formatter
@@ -17,19 +20,34 @@ class JsonFormatter(logging.Formatter):
             "module": record.name,
             "event": record.getMessage(),
             "details": record.details if hasattr(record, 'details') else None,
-            "error_trace": record.exc_text if record.exc_info else None,
+            "error_trace": self.formatException(record.exc_info) if record.exc_info else None,
         }
-        # Dump the dictionary to a JSON string
-        return json.dumps(log_record)
+        # Dump the dictionary to a JSON string (orjson returns bytes);
+        # values orjson can't encode natively, e.g. Decimal, fall back to str
+        return orjson.dumps(log_record, default=str).decode()
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener running in the same process.
+    Records are enqueued as-is, so message formatting and tracebacks
+    are rendered by the listener thread rather than the caller.
+    """
+    def prepare(self, record):
+        return record
 
 def setup_logger():
     """
     Sets up a rotating file logger for the bot.
     Logs are written to 'bot.log' in a structured JSON format.
     The log file will rotate when it reaches 5MB, keeping up to 5 backups.
+    Logging calls only enqueue the record; file and console output are
+    written by a background QueueListener thread.
     """
     # Create logger instance
     logger = logging.getLogger('binance_bot_logger')
+    if logger.handlers:
+        # Already configured
+        return logger
     logger.setLevel(logging.INFO)
 
     # Use a specific format for the timestamp, e.g., ISO8601
@@ -41,14 +59,25 @@ def setup_logger():
     file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5)
     file_handler.setFormatter(formatter)
 
-    # Add the handler to the logger
-    logger.addHandler(file_handler)
-
     # Also add a stream handler for console output during development
     stream_handler = logging.StreamHandler(sys.stdout)
     # A simple formatter for console readability
     stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(stream_handler)
+
+    # Route records through a queue so disk and console I/O happen off the caller's thread
+    queue_handler = LocalQueueHandler(queue.SimpleQueue())
+    logger.addHandler(queue_handler)
+    listener = QueueListener(queue_handler.queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    if hasattr(os, 'register_at_fork'):
+        # Threads do not survive fork (e.g. Gunicorn --preload), so each child starts its own listener
+        def restart_listener():
+            queue_handler.queue = listener.queue = queue.SimpleQueue()
+            listener._thread = None
+            listener.start()
+        os.register_at_fork(after_in_child=restart_listener)
 
     return logger
 
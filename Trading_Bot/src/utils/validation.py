@@ -1,37 +1,351 @@
-import sys
+import os
+import math
+import time
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+import numpy as np
 from binance.exceptions import BinanceAPIException
 from src.utils.binance_client import BinanceClient
 from src.utils.logger import logger
 
+# Cached exchange info older than this is re-fetched on next use
+EXCHANGE_INFO_TTL_SECS = int(os.getenv("EXCHANGE_INFO_TTL_SECS", "3600"))
+# A background refresh starts this long before the TTL runs out, so
+# validations never have to wait on the re-fetch themselves
+EXCHANGE_INFO_PREFETCH_SECS = int(os.getenv("EXCHANGE_INFO_PREFETCH_SECS", "60"))
+if EXCHANGE_INFO_TTL_SECS <= 0:
+    raise ValueError("EXCHANGE_INFO_TTL_SECS must be a positive number of seconds.")
+# Exchange info is cached for at most this many clients; the least recently
+# used one is closed when another client needs a slot
+EXCHANGE_INFO_MAX_CLIENTS = 4
+# Background refreshes retry failed fetches with exponential backoff before giving up
+EXCHANGE_INFO_FETCH_ATTEMPTS = 3
+EXCHANGE_INFO_RETRY_BACKOFF_SECS = 0.5
+# The last successfully fetched exchange info is persisted here, so a bot
+# restarted without network access can still validate orders
+EXCHANGE_INFO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "trading_bot")
+# Quantities and prices are checked as integer multiples of the symbol's
+# precision; this absorbs float representation error (e.g. 0.002 * 1000)
+UNIT_TOLERANCE = 1e-6
+
+@dataclass(slots=True, frozen=True)
+class SymbolLimits:
+    """
+    The LOT_SIZE and PRICE_FILTER limits validation needs for one symbol.
+    Each limit is also kept in integer units of the symbol's precision (e.g. a
+    0.001 step is scale 1000, 1 unit), so step and tick checks are integer arithmetic.
+    """
+    min_qty: float
+    max_qty: float
+    step_size: float
+    min_price: float
+    max_price: float
+    tick_size: float
+    qty_scale: int
+    min_qty_units: int
+    max_qty_units: float
+    step_units: int
+    price_scale: int
+    min_price_units: int
+    max_price_units: float
+    tick_units: int
+
+    @classmethod
+    def from_filters(cls, filters):
+        """
+        Builds the limits from a symbol's exchange info filters.
+        :param filters: The symbol's list of filter dicts.
+        :return: A SymbolLimits, or None if either filter is missing.
+        """
+        filters_by_type = {f['filterType']: f for f in filters}
+        lot_size_filter = filters_by_type.get('LOT_SIZE')
+        price_filter = filters_by_type.get('PRICE_FILTER')
+        if not lot_size_filter or not price_filter:
+            return None
+
+        min_qty = Decimal(lot_size_filter['minQty'])
+        max_qty = Decimal(lot_size_filter['maxQty'])
+        step_size = Decimal(lot_size_filter['stepSize'])
+        min_price = Decimal(price_filter['minPrice'])
+        max_price = Decimal(price_filter['maxPrice'])
+        tick_size = Decimal(price_filter['tickSize'])
+        qty_scale = _decimal_scale(min_qty, step_size)
+        price_scale = _decimal_scale(min_price, tick_size)
+
+        return cls(
+            min_qty=float(min_qty),
+            max_qty=float(max_qty),
+            step_size=float(step_size),
+            min_price=float(min_price),
+            max_price=float(max_price),
+            tick_size=float(tick_size),
+            qty_scale=qty_scale,
+            min_qty_units=int(min_qty * qty_scale),
+            max_qty_units=float(max_qty * qty_scale),
+            step_units=int(step_size * qty_scale),
+            price_scale=price_scale,
+            min_price_units=int(min_price * price_scale),
+            max_price_units=float(max_price * price_scale),
+            tick_units=int(tick_size * price_scale),
+        )
+
+def _decimal_scale(*values):
+    """
+    Returns the smallest power of ten that makes every value an integer.
+    """
+    decimals = max(-min(v.normalize().as_tuple().exponent, 0) for v in values)
+    return 10 ** decimals
+
+class ExchangeInfoFetchError(Exception):
+    """
+    Raised when exchange info can't be fetched and no earlier copy is available.
+    """
+
 class ExchangeInfo:
     """
-    A class to fetch and cache Binance exchange information.
+    A class to fetch and cache Binance exchange information for one client.
     This avoids repeated API calls for validation.
+    Use get_exchange_info() to share one instance per client. Once loaded,
+    the data is refreshed by a background timer shortly before it expires.
     """
-    _instance = None
-    _info = None
+    def __init__(self, client, ttl=EXCHANGE_INFO_TTL_SECS):
+        """
+        :param client: The BinanceClient instance. Its underlying Binance Client
+                       is only needed, and so only created, when fetching.
+        :param ttl: Seconds before the cached data is considered stale.
+        """
+        self._client = client
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._symbols = None
+        self._fetched_at = None
+        self._refresh_timer = None
+        self._closed = False
+        # Bumped on every load so results memoized against older data are not reused
+        self.version = 0
+
+    def _is_stale(self):
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self._ttl
+
+    def ensure_loaded(self):
+        """
+        Fetches the exchange info if nothing has been loaded yet. Concurrent callers
+        wait for a single fetch instead of each issuing one. Expired data is still
+        returned while it is re-fetched in the background, so callers never wait on
+        retries during an outage. Once a first load has failed, it is only retried
+        in the background and callers fail fast until it succeeds.
+        :raises ExchangeInfoFetchError: If nothing could be fetched or restored.
+        """
+        if not self._is_stale():
+            return
+        if self._symbols is not None:
+            self._refresh_in_background()
+            return
+        if self._refresh_timer is None:
+            with self._lock:
+                # Another thread may have loaded, or failed to load, while this one waited
+                if self._symbols is None and self._refresh_timer is None:
+                    self._fetch(attempts=1)
+        if self._symbols is None:
+            raise ExchangeInfoFetchError("Exchange info is not loaded yet; retrying in the background.")
+
+    def _refresh_in_background(self):
+        """
+        Starts a background refresh unless one is already scheduled or running.
+        """
+        if not self._lock.acquire(blocking=False):
+            # A fetch is in progress
+            return
+        try:
+            if self._refresh_timer is None or self._refresh_timer.finished.is_set():
+                self._schedule_refresh(0)
+        finally:
+            self._lock.release()
 
-    def __new__(cls, client):
-        if cls._instance is None:
-            cls._instance = super(ExchangeInfo, cls).__new__(cls)
+    def refresh(self):
+        """
+        Re-fetches the exchange info. On failure the previously cached data is kept.
+        """
+        with self._lock:
+            self._fetch()
+
+    def _fetch(self, attempts=EXCHANGE_INFO_FETCH_ATTEMPTS):
+        """
+        Fetches the exchange info, retrying with exponential backoff. If every
+        attempt fails, already cached data is kept and the refresh is retried
+        in the background. With nothing cached, the copy persisted by the last
+        successful fetch is used instead.
+        :param attempts: How many times to try the fetch.
+        """
+        for attempt in range(attempts):
             try:
-                # Fetch exchange info and store it
-                cls._info = client.futures_exchange_info()
+                info = self._client.get_client().futures_exchange_info()
+                break
             except (BinanceAPIException, Exception) as e:
-                client.handle_error(e)
-                sys.exit(1)
-        return cls._instance
+                error = e
+                if attempt + 1 < attempts:
+                    time.sleep(EXCHANGE_INFO_RETRY_BACKOFF_SECS * 2 ** attempt)
+        else:
+            self._client.handle_error(error)
+            if self._symbols is None:
+                info = self._read_persisted()
+                if info is None:
+                    self._schedule_refresh(EXCHANGE_INFO_PREFETCH_SECS)
+                    raise ExchangeInfoFetchError("Could not fetch exchange info.") from error
+                logger.warning("Using persisted exchange info until Binance is reachable.")
+                self._load(info)
+            self._schedule_refresh(EXCHANGE_INFO_PREFETCH_SECS)
+            return
+
+        self._persist(info)
+        self._load(info)
+
+    def _cache_path(self):
+        network = "mainnet" if self._client.mainnet else "testnet"
+        return os.path.join(EXCHANGE_INFO_CACHE_DIR, f"exchange_info_{network}.json")
+
+    def _persist(self, info):
+        """
+        Saves the raw exchange info to disk. Failures are logged, not raised.
+        """
+        path = self._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a partial cache
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(info, f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.warning("Could not persist exchange info: %s", e)
+
+    def _read_persisted(self):
+        """
+        Loads the exchange info saved by the last successful fetch, or None.
+        """
+        try:
+            with open(self._cache_path(), encoding="utf-8") as f:
+                return json.load(f)
+        # ValueError covers a corrupt or truncated file
+        except (OSError, ValueError):
+            return None
+
+    def _load(self, info):
+        """
+        Replaces the cached data with the SymbolLimits of every symbol in the
+        exchange info; symbols missing a filter map to None. Only the limits
+        are kept, not the raw exchange info.
+        """
+        self._symbols = {s['symbol']: SymbolLimits.from_filters(s['filters']) for s in info['symbols']}
+        self.version += 1
+        self._fetched_at = time.monotonic()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, delay=None):
+        """
+        Schedules a background refresh, by default EXCHANGE_INFO_PREFETCH_SECS before the TTL expires.
+        If the prefetch window is not shorter than the TTL, the refresh runs halfway
+        through the TTL instead, so a refresh never immediately schedules the next.
+        :param delay: Seconds until the refresh, overriding the default.
+        """
+        if self._closed:
+            return
+        if delay is None:
+            delay = max(self._ttl - EXCHANGE_INFO_PREFETCH_SECS, self._ttl / 2)
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._refresh_timer = threading.Timer(delay, self.refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+        # close() may have run while the timer was being replaced
+        if self._closed:
+            self._refresh_timer.cancel()
+
+    def close(self):
+        """
+        Stops the background refresh, so an instance that is no longer shared
+        stops fetching and can be freed.
+        """
+        self._closed = True
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+
+    def __contains__(self, symbol):
+        return bool(self._symbols) and symbol in self._symbols
 
-    def get_symbol_info(self, symbol):
+    def get_symbol_limits(self, symbol):
         """
-        Retrieves the symbol-specific information from the cached data.
+        Retrieves the validation limits for a symbol from the cached data.
+        :return: The symbol's SymbolLimits, or None if it is unknown or missing a filter.
         """
-        if self._info:
-            for s in self._info['symbols']:
-                if s['symbol'] == symbol:
-                    return s
+        if self._symbols:
+            return self._symbols.get(symbol)
         return None
 
+_exchange_info_lock = threading.Lock()
+_exchange_infos = OrderedDict()
+
+def _exchange_info_for(client):
+    """
+    Returns the client's ExchangeInfo from the shared cache, creating it if needed
+    and closing the least recently used one if the cache is full.
+    Must be called with _exchange_info_lock held.
+    """
+    exchange_info = _exchange_infos.get(client)
+    if exchange_info is not None:
+        _exchange_infos.move_to_end(client)
+        return exchange_info
+
+    exchange_info = _exchange_infos[client] = ExchangeInfo(client)
+    if len(_exchange_infos) > EXCHANGE_INFO_MAX_CLIENTS:
+        _, evicted = _exchange_infos.popitem(last=False)
+        evicted.close()
+        # The validation memo is keyed on the instance; drop it so it doesn't keep evicted ones alive
+        _validate_cached.cache_clear()
+    return exchange_info
+
+def _clear_exchange_info_cache():
+    """
+    Closes and drops every cached ExchangeInfo, along with the validation memo.
+    """
+    with _exchange_info_lock:
+        for exchange_info in _exchange_infos.values():
+            exchange_info.close()
+        _exchange_infos.clear()
+        _validate_cached.cache_clear()
+
+def get_exchange_info(client):
+    """
+    Returns the shared ExchangeInfo for a client, fetching or re-fetching
+    the exchange info if it is missing or older than EXCHANGE_INFO_TTL_SECS.
+    :param client: The BinanceClient instance.
+    :raises ExchangeInfoFetchError: If nothing could be fetched or restored.
+    """
+    with _exchange_info_lock:
+        exchange_info = _exchange_info_for(client)
+    exchange_info.ensure_loaded()
+    return exchange_info
+
+def prewarm_exchange_info(client):
+    """
+    Starts fetching the exchange info for a client in a background thread, so
+    the first validation finds it cached instead of waiting on the REST call.
+    A validation that arrives while the fetch is still in flight waits for it
+    rather than fetching again.
+    :param client: The BinanceClient instance.
+    """
+    threading.Thread(target=_prewarm, args=(client,), daemon=True).start()
+
+def _prewarm(client):
+    try:
+        get_exchange_info(client)
+    except ExchangeInfoFetchError:
+        # Already logged; the first validation will try the fetch again
+        pass
+
 def validate_input(client, symbol, quantity, price=None):
     """
     Validates a trading pair, quantity, and price against Binance's exchange information.
@@ -41,58 +355,129 @@ def validate_input(client, symbol, quantity, price=None):
     :param price: The order price (optional, for limit orders).
     :return: True if validation passes, False otherwise.
     """
-    exchange_info = ExchangeInfo(client.get_client())
-    symbol_info = exchange_info.get_symbol_info(symbol)
+    return validate_inputs(client, [(symbol, quantity, price)])[0]
 
-    if not symbol_info:
-        logger.error(f"Invalid symbol: {symbol}", extra={'details': 'Symbol not found in exchange info.'})
-        return False
+def validate_inputs(client, orders):
+    """
+    Validates several orders (e.g. the legs of a grid or OCO order) against
+    Binance's exchange information, resolving the exchange info once for the batch.
+    :param client: The BinanceClient instance.
+    :param orders: Iterable of (symbol, quantity, price) tuples; price may be None.
+    :return: A list of booleans, True for each order that passes validation.
+    """
+    try:
+        exchange_info = get_exchange_info(client)
+    except ExchangeInfoFetchError:
+        # Fail closed: without exchange info no order can be checked
+        logger.error("Exchange info unavailable, rejecting orders.", extra={'details': 'Could not fetch exchange info.'})
+        return [False for _ in orders]
+    info_version = exchange_info.version
+    results = []
 
-    # Get filters for price and quantity validation
-    price_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'PRICE_FILTER'), None)
-    lot_size_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'LOT_SIZE'), None)
+    for symbol, quantity, price in orders:
+        error = _validate_cached(exchange_info, info_version, symbol, quantity, price)
+        if error:
+            message, args, details = error
+            logger.error(message, *args, extra={'details': details})
+        results.append(error is None)
 
-    if not price_filter or not lot_size_filter:
-        logger.error(f"Could not retrieve filters for symbol: {symbol}", extra={'details': 'Missing price or lot size filter.'})
-        return False
+    return results
 
-    min_qty = float(lot_size_filter['minQty'])
-    max_qty = float(lot_size_filter['maxQty'])
-    step_size = float(lot_size_filter['stepSize'])
+def validate_batch(symbol_limits, qty, px=None):
+    """
+    Validates many orders for one symbol at once, e.g. when replaying orders in
+    a backtest. Applies the same checks as validate_input, vectorized with NumPy
+    and without logging.
+    :param symbol_limits: The symbol's SymbolLimits, from ExchangeInfo.get_symbol_limits().
+    :param qty: NumPy array of order quantities.
+    :param px: NumPy array of order prices, or None to skip the price checks.
+    :return: NumPy boolean array, True for each order that passes validation.
+    """
+    mask = _units_valid(
+        np.asarray(qty, dtype=float) * symbol_limits.qty_scale,
+        symbol_limits.min_qty_units, symbol_limits.max_qty_units, symbol_limits.step_units
+    )
+    if px is not None:
+        mask &= _units_valid(
+            np.asarray(px, dtype=float) * symbol_limits.price_scale,
+            symbol_limits.min_price_units, symbol_limits.max_price_units, symbol_limits.tick_units
+        )
+    return mask
+
+def _units_valid(units, min_units, max_units, step_units):
+    """
+    Vectorized range and step check on values already scaled to integer units.
+    """
+    rounded = np.round(units)
+    return (
+        (units >= min_units - UNIT_TOLERANCE) & (units <= max_units + UNIT_TOLERANCE)
+        & (np.abs(units - rounded) <= UNIT_TOLERANCE)
+        & ((rounded - min_units) % step_units == 0)
+    )
 
-    # Validate quantity
-    if quantity < min_qty or quantity > max_qty:
-        logger.error(
-            f"Invalid quantity {quantity} for {symbol}. Min: {min_qty}, Max: {max_qty}",
-            extra={'details': {'quantity': quantity, 'min': min_qty, 'max': max_qty}}
+@lru_cache(maxsize=4096)
+def _validate_cached(exchange_info, info_version, symbol, quantity, price):
+    """
+    Checks an order against the cached exchange info. Results are memoized, so
+    grid and TWAP loops re-validating the same order skip the checks entirely;
+    info_version is part of the key so a refresh invalidates earlier results.
+    :return: None if validation passes, otherwise a (message, args, details) tuple to
+             log. The message is left unformatted so logging only formats it if emitted.
+    """
+    if symbol not in exchange_info:
+        return "Invalid symbol: %s", (symbol,), 'Symbol not found in exchange info.'
+
+    # Price and quantity limits, parsed when the exchange info was cached
+    limits = exchange_info.get_symbol_limits(symbol)
+
+    if not limits:
+        return "Could not retrieve filters for symbol: %s", (symbol,), 'Missing price or lot size filter.'
+
+    # NaN slips through the range comparisons below and can't be rounded
+    if not math.isfinite(quantity) or (price is not None and not math.isfinite(price)):
+        return (
+            "Invalid quantity %s or price %s for %s. Both must be finite numbers",
+            (quantity, price, symbol),
+            {'quantity': quantity, 'price': price}
         )
-        return False
 
-    if (quantity - min_qty) % step_size != 0:
-        logger.error(
-            f"Invalid quantity step for {symbol}. Step size is {step_size}",
-            extra={'details': {'quantity': quantity, 'stepSize': step_size}}
+    min_qty_units = limits.min_qty_units
+
+    # Validate quantity, in integer units of the symbol's quantity precision
+    quantity_units = quantity * limits.qty_scale
+    if quantity_units < min_qty_units - UNIT_TOLERANCE or quantity_units > limits.max_qty_units + UNIT_TOLERANCE:
+        return (
+            "Invalid quantity %s for %s. Min: %s, Max: %s",
+            (quantity, symbol, limits.min_qty, limits.max_qty),
+            {'quantity': quantity, 'min': limits.min_qty, 'max': limits.max_qty}
+        )
+
+    rounded_units = round(quantity_units)
+    if abs(quantity_units - rounded_units) > UNIT_TOLERANCE or (rounded_units - min_qty_units) % limits.step_units:
+        return (
+            "Invalid quantity step for %s. Step size is %s",
+            (symbol, limits.step_size),
+            {'quantity': quantity, 'stepSize': limits.step_size}
         )
-        return False
-
-    # Validate price if provided
-    if price:
-        min_price = float(price_filter['minPrice'])
-        max_price = float(price_filter['maxPrice'])
-        tick_size = float(price_filter['tickSize'])
-
-        if price < min_price or price > max_price:
-            logger.error(
-                f"Invalid price {price} for {symbol}. Min: {min_price}, Max: {max_price}",
-                extra={'details': {'price': price, 'min': min_price, 'max': max_price}}
+
+    # Validate price if provided; a price of 0 is checked (and rejected), not skipped
+    if price is not None:
+        min_price_units = limits.min_price_units
+        price_units = price * limits.price_scale
+
+        if price_units < min_price_units - UNIT_TOLERANCE or price_units > limits.max_price_units + UNIT_TOLERANCE:
+            return (
+                "Invalid price %s for %s. Min: %s, Max: %s",
+                (price, symbol, limits.min_price, limits.max_price),
+                {'price': price, 'min': limits.min_price, 'max': limits.max_price}
             )
-            return False
 
-        if (price - min_price) % tick_size != 0:
-            logger.error(
-                f"Invalid price tick size for {symbol}. Tick size is {tick_size}",
-                extra={'details': {'price': price, 'tickSize': tick_size}}
+        rounded_units = round(price_units)
+        if abs(price_units - rounded_units) > UNIT_TOLERANCE or (rounded_units - min_price_units) % limits.tick_units:
+            return (
+                "Invalid price tick size for %s. Tick size is %s",
+                (symbol, limits.tick_size),
+                {'price': price, 'tickSize': limits.tick_size}
             )
-            return False
 
-    return True
\ No newline at end of file
+    return None
@@ -0,0 +1,16 @@
+import pytest
+from src.utils import validation
+from src.utils.validation import _clear_exchange_info_cache
+
+@pytest.fixture(autouse=True)
+def reset_exchange_info_cache(tmp_path, monkeypatch):
+    """
+    Drops the cached ExchangeInfo instances between tests, so exchange info
+    fetched by one test never leaks into the next, and keeps the persisted
+    copy out of the real cache directory.
+    """
+    monkeypatch.setattr(validation, 'EXCHANGE_INFO_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(validation, 'EXCHANGE_INFO_RETRY_BACKOFF_SECS', 0)
+    _clear_exchange_info_cache()
+    yield
+    _clear_exchange_info_cache()
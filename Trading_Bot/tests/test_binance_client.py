@@ -0,0 +1,56 @@
+import unittest
+import hmac
+import hashlib
+from unittest.mock import patch
+import httpx
+from binance.exceptions import BinanceAPIException
+from src.utils.binance_client import AsyncFuturesClient, FUTURES_URL, FUTURES_TESTNET_URL
+
+class TestAsyncFuturesClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Record every request and answer from a MockTransport instead of the network
+        self.requests = []
+        self.response = httpx.Response(200, json={"orderId": 123})
+        def handler(request):
+            self.requests.append(request)
+            return self.response
+        self.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.client = AsyncFuturesClient('key', 'secret', testnet=True, http_client=self.http_client)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    @patch('src.utils.binance_client.time.time', return_value=1700000000.123)
+    async def test_signed_order_request(self, mock_time):
+        """Test that orders are signed over the exact query string that is sent."""
+        order = await self.client.futures_create_order(symbol='BTCUSDT', side='BUY', type='MARKET', quantity=0.001)
+        self.assertEqual(order, {"orderId": 123})
+
+        request = self.requests[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(f"{request.url.scheme}://{request.url.host}{request.url.path}", f"{FUTURES_TESTNET_URL}/fapi/v1/order")
+        self.assertEqual(request.headers['X-MBX-APIKEY'], 'key')
+
+        query, signature = request.url.query.decode().split('&signature=')
+        self.assertEqual(query, 'symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.001&timestamp=1700000000123')
+        self.assertEqual(signature, hmac.new(b'secret', query.encode(), hashlib.sha256).hexdigest())
+
+    async def test_unsigned_request(self):
+        """Test that public endpoints are sent without a timestamp or signature."""
+        client = AsyncFuturesClient('key', 'secret', testnet=False, http_client=self.http_client)
+        await client.futures_symbol_ticker(symbol='BTCUSDT')
+        await client.futures_exchange_info()
+
+        self.assertEqual(str(self.requests[0].url), f"{FUTURES_URL}/fapi/v1/ticker/price?symbol=BTCUSDT")
+        self.assertEqual(str(self.requests[1].url), f"{FUTURES_URL}/fapi/v1/exchangeInfo")
+
+    async def test_error_response_raises(self):
+        """Test that a non-2xx response raises BinanceAPIException with Binance's error code."""
+        self.response = httpx.Response(400, json={"code": -1100, "msg": "Illegal characters found in parameter."})
+        with self.assertRaises(BinanceAPIException) as cm:
+            await self.client.futures_create_order(symbol='BTCUSDT', side='BUY', type='MARKET', quantity=0.001)
+        self.assertEqual(cm.exception.status_code, 400)
+        self.assertEqual(cm.exception.code, -1100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import Mock, AsyncMock
+from binance.exceptions import BinanceAPIException
+from src.advanced.grid_strategy import place_grid_orders
+
+EXCHANGE_INFO = {
+    'symbols': [
+        {
+            'symbol': 'BTCUSDT',
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.10', 'maxPrice': '1000000', 'tickSize': '0.10'},
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.001'}
+            ]
+        }
+    ]
+}
+
+class TestGridStrategy(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Mock the BinanceClient: exchange info for validation, and an async order endpoint
+        self.mock_client = Mock()
+        self.mock_client.get_client.return_value.futures_exchange_info.return_value = EXCHANGE_INFO
+        self.mock_binance_client = self.mock_client.get_async_client()
+        self.mock_binance_client.futures_create_order = AsyncMock(side_effect=self.create_order)
+        self.failing_price = None
+
+    async def create_order(self, **params):
+        if params['price'] == self.failing_price:
+            raise BinanceAPIException(response=Mock(status_code=400), status_code=400, text='{"code": -2019, "msg": "Margin is insufficient."}')
+        return {'side': params['side'], 'price': params['price']}
+
+    def placed_orders(self):
+        return [call.kwargs for call in self.mock_binance_client.futures_create_order.call_args_list]
+
+    async def test_grid_places_every_level(self):
+        """Test that every grid level is sent as a GTC limit order."""
+        orders = await place_grid_orders(self.mock_client, 'BTCUSDT', 100, 130, 4, 0.001)
+        self.assertEqual(len(orders), 4)
+        for params in self.placed_orders():
+            self.assertEqual(params['type'], 'LIMIT')
+            self.assertEqual(params['timeInForce'], 'GTC')
+            self.assertEqual(params['quantity'], 0.001)
+
+    async def test_grid_level_failure_returns_remaining_orders(self):
+        """Test that one failed level is reported while the other levels are still placed and returned."""
+        self.failing_price = 110.0
+        self.mock_client.handle_error = Mock()
+        orders = await place_grid_orders(self.mock_client, 'BTCUSDT', 100, 130, 4, 0.001)
+        self.assertEqual([order['price'] for order in orders], [100.0, 120.0, 130.0])
+        self.assertEqual(self.mock_binance_client.futures_create_order.call_count, 4)
+        self.mock_client.handle_error.assert_called_once()
+
+    async def test_grid_validation_failure_places_nothing(self):
+        """Test that no level is sent if the grid fails validation."""
+        orders = await place_grid_orders(self.mock_client, 'BTCUSDT', 100, 130, 4, 0.0015)
+        self.assertIsNone(orders)
+        self.assertFalse(self.mock_binance_client.futures_create_order.called)
+
+    async def test_grid_off_tick_bounds_are_snapped(self):
+        """Test that levels from off-tick bounds are snapped to the tick size and pass validation."""
+        orders = await place_grid_orders(self.mock_client, 'BTCUSDT', 60000.03, 60000.97, 3, 0.001)
+        self.assertEqual([params['price'] for params in self.placed_orders()], [60000.0, 60000.5, 60001.0])
+        self.assertEqual(len(orders), 3)
+
+    async def test_grid_buys_below_and_sells_above_midpoint(self):
+        """Test that levels below the grid's midpoint are BUY orders and levels above it are SELL orders."""
+        await place_grid_orders(self.mock_client, 'BTCUSDT', 100, 130, 4, 0.001)
+        sides = {params['price']: params['side'] for params in self.placed_orders()}
+        self.assertEqual(sides, {100.0: 'BUY', 110.0: 'BUY', 120.0: 'SELL', 130.0: 'SELL'})
+
+    async def test_grid_levels_closer_than_tick_places_nothing(self):
+        """Test that a grid whose levels snap onto the same tick is rejected instead of placing duplicate orders."""
+        orders = await place_grid_orders(self.mock_client, 'BTCUSDT', 100, 100.2, 5, 0.001)
+        self.assertIsNone(orders)
+        self.assertFalse(self.mock_binance_client.futures_create_order.called)
+
+if __name__ == '__main__':
+    unittest.main()
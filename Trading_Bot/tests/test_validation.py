@@ -1,11 +1,11 @@
+import gc
 import unittest
+import threading
+import weakref
+import numpy as np
 from unittest.mock import Mock, MagicMock
-import sys
-
-# Add the src directory to the path so we can import modules
-sys.path.insert(0, './src')
-from utils.validation import validate_input, ExchangeInfo
-from utils.binance_client import BinanceClient
+from src.utils.validation import validate_input, validate_inputs, validate_batch, get_exchange_info, ExchangeInfo, EXCHANGE_INFO_MAX_CLIENTS, _exchange_infos
+from src.utils.binance_client import BinanceClient
 
 class MockClient:
     """Mock for the BinanceClient to simulate API responses."""
@@ -35,6 +35,10 @@ class TestValidation(unittest.TestCase):
         """Test with a valid symbol, quantity, and price."""
         self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002, 65000.00))
 
+    def test_valid_input_not_exact_in_binary(self):
+        """Test quantities and prices whose float step remainder is not exactly zero."""
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.3, 0.07))
+
     def test_invalid_symbol(self):
         """Test with an invalid symbol."""
         self.assertFalse(validate_input(self.mock_client, 'XYZUSDT', 0.002, 65000.00))
@@ -55,5 +59,117 @@ class TestValidation(unittest.TestCase):
         """Test with a price below the minimum allowed."""
         self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002, 0.005))
 
+    def test_invalid_price_zero(self):
+        """Test that a zero price is validated rather than treated as no price."""
+        self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002, 0))
+
+    def test_invalid_non_finite_values(self):
+        """Test that NaN or infinite quantities and prices are rejected rather than raising."""
+        orders = [('BTCUSDT', float('nan'), None), ('BTCUSDT', 0.002, float('nan')), ('BTCUSDT', float('inf'), 65000.00)]
+        self.assertEqual(validate_inputs(self.mock_client, orders), [False, False, False])
+
+    def test_exchange_info_is_cached_per_client(self):
+        """Test that a new client gets its own exchange info instead of the first client's."""
+        other_client = Mock()
+        other_client.get_client.return_value.futures_exchange_info.return_value = {'symbols': []}
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        self.assertFalse(validate_input(other_client, 'BTCUSDT', 0.002))
+
+    def test_refresh_invalidates_memoized_results(self):
+        """Test that a result memoized before a refresh is not reused after it."""
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        self.mock_client.get_client.return_value.futures_exchange_info = lambda: {'symbols': []}
+        get_exchange_info(self.mock_client).refresh()
+        self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+
+    def test_validate_inputs_batch(self):
+        """Test that each order in a batch gets its own result, in order."""
+        orders = [('BTCUSDT', 0.002, 65000.00), ('XYZUSDT', 0.002, None), ('BTCUSDT', 0.0025, None)]
+        self.assertEqual(validate_inputs(self.mock_client, orders), [True, False, False])
+
+    def test_fetch_failure_rejects_orders(self):
+        """Test that validation fails closed when exchange info can't be fetched."""
+        self.mock_client.get_client.return_value.futures_exchange_info = Mock(side_effect=Exception("network down"))
+        self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+
+    def test_failed_first_load_is_retried_in_background_only(self):
+        """Test that after a failed first load, validations fail fast instead of fetching again."""
+        failing_fetch = Mock(side_effect=Exception("network down"))
+        self.mock_client.get_client.return_value.futures_exchange_info = failing_fetch
+        self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        self.assertFalse(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        self.assertEqual(failing_fetch.call_count, 1)
+        self.assertFalse(_exchange_infos[self.mock_client]._refresh_timer.finished.is_set())
+
+    def test_fetch_failure_uses_persisted_info(self):
+        """Test that the exchange info persisted by an earlier fetch is used when fetching fails."""
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        offline_client = Mock()
+        offline_client.get_client.return_value.futures_exchange_info = Mock(side_effect=Exception("network down"))
+        self.assertTrue(validate_input(offline_client, 'BTCUSDT', 0.002))
+
+    def test_validate_batch_matches_validate_input(self):
+        """Test that the vectorized batch check agrees with validate_input order by order."""
+        qty = np.array([0.002, 0.3, 0.0025, 0.0005, 0.002, 0.002])
+        px = np.array([65000.00, 0.07, 65000.00, 65000.00, 65000.001, 0.005])
+        limits = get_exchange_info(self.mock_client).get_symbol_limits('BTCUSDT')
+        expected = [validate_input(self.mock_client, 'BTCUSDT', q, p) for q, p in zip(qty.tolist(), px.tolist())]
+        self.assertEqual(validate_batch(limits, qty, px).tolist(), expected)
+        self.assertEqual(validate_batch(limits, qty).tolist()[:4], [True, True, False, False])
+
+    def test_refresh_delay_with_prefetch_longer_than_ttl(self):
+        """Test that a TTL shorter than the prefetch window doesn't schedule back-to-back refreshes."""
+        exchange_info = ExchangeInfo(self.mock_client, ttl=30)
+        exchange_info.ensure_loaded()
+        exchange_info._refresh_timer.cancel()
+        self.assertEqual(exchange_info._refresh_timer.interval, 15)
+
+    def test_expired_info_is_served_while_refetching_in_background(self):
+        """Test that expired exchange info is still used and the failing re-fetch never runs on the caller's thread."""
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002))
+        exchange_info = get_exchange_info(self.mock_client)
+        # Expire the data as if the scheduled refresh had already run
+        exchange_info._refresh_timer.cancel()
+        exchange_info._fetched_at -= exchange_info._ttl
+        fetch_threads = []
+        def failing_fetch():
+            fetch_threads.append(threading.current_thread())
+            raise Exception("network down")
+        self.mock_client.get_client.return_value.futures_exchange_info = failing_fetch
+
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002, 65000.01))
+        background_refresh = exchange_info._refresh_timer
+        background_refresh.join(timeout=5)
+        # The failed refresh schedules a retry; don't leave it running
+        exchange_info._refresh_timer.cancel()
+        self.assertTrue(fetch_threads)
+        self.assertNotIn(threading.current_thread(), fetch_threads)
+
+    def test_evicted_exchange_info_stops_refreshing(self):
+        """Test that an ExchangeInfo evicted from the shared cache cancels its refresh timer."""
+        first = get_exchange_info(self.mock_client)
+        for _ in range(EXCHANGE_INFO_MAX_CLIENTS):
+            other_client = Mock()
+            other_client.get_client.return_value = MockClient()
+            get_exchange_info(other_client)
+        self.assertTrue(first._refresh_timer.finished.is_set())
+        self.assertIsNot(get_exchange_info(self.mock_client), first)
+
+    def test_evicted_exchange_info_is_not_kept_alive_by_validation_memo(self):
+        """Test that memoized validation results don't pin an evicted ExchangeInfo in memory."""
+        self.assertTrue(validate_input(self.mock_client, 'BTCUSDT', 0.002, 65000.00))
+        first = get_exchange_info(self.mock_client)
+        first_ref = weakref.ref(first)
+        refresh_timer = first._refresh_timer
+        del first
+        for _ in range(EXCHANGE_INFO_MAX_CLIENTS):
+            other_client = Mock()
+            other_client.get_client.return_value = MockClient()
+            get_exchange_info(other_client)
+        refresh_timer.join(timeout=5)
+        del refresh_timer
+        gc.collect()
+        self.assertIsNone(first_ref())
+
 if __name__ == '__main__':
     unittest.main()